@@ -4,25 +4,607 @@ FastAPI service for imalink-core
 Exposes image processing as HTTP API for language-agnostic access.
 """
 
+import asyncio
+import os
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import (
+    BackgroundTasks,
+    FastAPI,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from imalink_schemas import PhotoCreateSchema, ImageFileCreateSchema
-from imalink_core.metadata.exif_extractor import ExifExtractor
-from imalink_core.preview.generator import PreviewGenerator
+from imalink_core.metadata.exif_extractor import BasicMetadata, CameraSettings, ExifExtractor
+from imalink_core.preview.generator import (
+    ColdPreview,
+    HotPreview,
+    HothashCalculator,
+    PreviewGenerator,
+)
 from imalink_core.image.raw_processor import RawProcessor
 from PIL import Image, ImageOps
 
+
+ProcessingResult = Tuple[BasicMetadata, CameraSettings, HotPreview, Optional[ColdPreview]]
+
+T = TypeVar("T")
+
+
+class _ResultCache:
+    """
+    LRU cache of processing results, keyed on upload content.
+    
+    Re-uploads of the same image (retries, rescans) skip decode, EXIF
+    parsing and preview encoding. Only accessed from the event loop, so no
+    locking is needed. A None key (caching disabled, see _cache_key) is
+    never stored or found.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Any, ...], ProcessingResult]" = OrderedDict()
+    
+    def get(self, key: Optional[Tuple[Any, ...]]) -> Optional[ProcessingResult]:
+        if key is None:
+            return None
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+    
+    def put(self, key: Optional[Tuple[Any, ...]], result: ProcessingResult) -> None:
+        if key is None or self.maxsize <= 0:
+            return
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Worker processes serving this app (see __main__). Each has its own cache,
+# limiter and deferred results, so per-process defaults are split between them.
+_workers = max(1, int(os.getenv("IMALINK_WORKERS", "1")))
+
+# Coldpreviews can be several MB each - keep the default modest. 0 disables caching.
+_result_cache = _ResultCache(
+    maxsize=int(os.getenv("IMALINK_CACHE_SIZE", max(1, 128 // _workers)))
+)
+
+
+class _ProcessingLimiter:
+    """
+    Bounds how many images are decoded at once.
+    
+    Every in-flight image holds its full-resolution bitmap (~100 MB for a
+    24 MP photo) plus previews, so unbounded concurrency can exhaust memory.
+    Extra requests wait for a slot instead.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.waiting = 0  # Requests currently queued for a slot
+        self._semaphore = asyncio.Semaphore(limit)
+    
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+
+# Processing is CPU-bound - default to one slot per core, split between workers
+_limiter = _ProcessingLimiter(
+    int(os.getenv("IMALINK_MAX_CONCURRENCY", max(1, (os.cpu_count() or 1) // _workers)))
+)
+
+
+# Pending (None), the finished photo, or the error generation raised
+DeferredResult = Union[PhotoCreateSchema, HTTPException, None]
+
+
+class _DeferredResults:
+    """
+    Photos whose coldpreview is generated after the response was sent.
+    
+    Keyed by an opaque token. An entry is None while pending, then the
+    complete PhotoCreateSchema - or the HTTPException that generation
+    raised. Finished entries are removed once collected (pop). Entries
+    older than ttl seconds, and the oldest beyond maxsize, are dropped so
+    uncollected coldpreviews don't pin memory.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # token -> (creation time, result)
+        self._entries: "OrderedDict[str, Tuple[float, DeferredResult]]" = OrderedDict()
+    
+    def _expire(self) -> None:
+        # Insertion order is creation order, so expired entries are at the front
+        deadline = time.monotonic() - self.ttl
+        while self._entries and next(iter(self._entries.values()))[0] <= deadline:
+            self._entries.popitem(last=False)
+    
+    def create(self) -> str:
+        self._expire()
+        token = uuid.uuid4().hex
+        self._entries[token] = (time.monotonic(), None)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return token
+    
+    def set(self, token: str, result: Union[PhotoCreateSchema, HTTPException]) -> None:
+        if token in self._entries:  # May have been dropped while pending
+            created, _ = self._entries[token]
+            self._entries[token] = (created, result)
+    
+    def pop(self, token: str) -> DeferredResult:
+        """
+        Get the result for a token, removing it once finished.
+        
+        Raises:
+            KeyError: Unknown, expired or already collected token
+        """
+        self._expire()
+        _, result = self._entries[token]
+        if result is not None:
+            del self._entries[token]
+        return result
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Each finished entry holds a full photo including Base64 coldpreview, so keep
+# the cap small; uncollected results expire after IMALINK_DEFERRED_TTL seconds.
+_deferred_results = _DeferredResults(
+    maxsize=int(os.getenv("IMALINK_DEFERRED_SIZE", max(1, 32 // _workers))),
+    ttl=float(os.getenv("IMALINK_DEFERRED_TTL", "120"))
+)
+
+# Upper bound on files per /v1/process_batch request
+_max_batch_files = int(os.getenv("IMALINK_MAX_BATCH_FILES", "100"))
+
+
+class ErrorResponse(BaseModel):
+    """Error response"""
+    error: str
+    detail: Optional[str] = None
+
+
+class BatchItemResult(BaseModel):
+    """One NDJSON line of a /v1/process_batch response"""
+    index: int  # Position of the file in the request
+    filename: str
+    photo: Optional[PhotoCreateSchema] = None
+    error: Optional[str] = None
+
+
+def _timed(timings: Dict[str, float], stage: str, func: Callable[..., T], *args: Any) -> T:
+    """Call func(*args), recording its duration in milliseconds as timings[stage]."""
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        timings[stage] = (time.perf_counter() - start) * 1000
+
+
+def _server_timing(timings: Dict[str, float]) -> str:
+    """
+    Format stage durations as a Server-Timing header value.
+    
+    Example: "hash;dur=0.41, queue;dur=0.02, decode;dur=35.10"
+    """
+    return ", ".join(f"{stage};dur={ms:.2f}" for stage, ms in timings.items())
+
+
+async def _cache_key(
+    image_bytes: bytes,
+    filename: str,
+    coldpreview_size: Optional[int],
+    timings: Dict[str, float]
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Build the _result_cache key: same bytes + same options = same result.
+    
+    Hashing runs in C and releases the GIL, so it is cheap next to a full
+    decode - but it is skipped entirely (returning None) when caching is
+    disabled.
+    """
+    if _result_cache.maxsize <= 0:
+        return None
+    content_hash = await asyncio.to_thread(
+        _timed, timings, "hash", HothashCalculator.calculate, image_bytes
+    )
+    return (content_hash, RawProcessor.is_raw_file(filename), coldpreview_size)
+
+
+def _open_image(image_bytes: bytes, filename: str) -> Image.Image:
+    """
+    Decode uploaded bytes to a PIL Image ready for preview generation.
+    
+    RAW files are converted with rawpy. Other formats are verified and
+    rotated according to their EXIF orientation.
+    
+    Raises:
+        HTTPException 400: If the file cannot be decoded
+    """
+    # Check if it's a RAW file and convert if needed
+    if RawProcessor.is_raw_file(filename):
+        # RAW file - convert to PIL Image using rawpy
+        if not RawProcessor.is_available():
+            raise HTTPException(
+                status_code=400,
+                detail="RAW file support not installed. Install with: uv pip install rawpy"
+            )
+        
+        success, img, error = RawProcessor.convert_raw_to_image(image_bytes)
+        if not success:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Failed to process RAW file: {error}"
+            )
+        
+        # RAW is already converted to correct orientation, no EXIF transpose needed
+        return img
+    
+    # Standard image format (JPEG, PNG, etc.) - validate and open
+    try:
+        img = Image.open(BytesIO(image_bytes))
+        img.verify()  # Check if it's a valid image
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid image file: {str(e)}"
+        )
+    
+    # Re-open image for processing (verify() closes it) and apply EXIF rotation
+    img = Image.open(BytesIO(image_bytes))
+    try:
+        img = ImageOps.exif_transpose(img)  # Rotate based on EXIF orientation
+    except Exception:
+        pass  # No EXIF orientation or already correct
+    
+    return img
+
+
+def _generate_previews(
+    img: Image.Image,
+    image_bytes: bytes,
+    coldpreview_size: Optional[int],
+    timings: Dict[str, float]
+) -> Tuple[HotPreview, Optional[ColdPreview]]:
+    """
+    Generate hotpreview and (optionally) coldpreview from a decoded image.
+    
+    A JPEG upload that already fits coldpreview_size is reused as the
+    coldpreview instead of being re-encoded.
+    
+    Raises:
+        HTTPException 400: If the image is too small (< 4x4 pixels)
+    """
+    try:
+        hotpreview = _timed(
+            timings, "hotpreview", PreviewGenerator.generate_hotpreview_from_image, img
+        )
+        coldpreview = None
+        if coldpreview_size is not None:
+            start = time.perf_counter()
+            coldpreview = PreviewGenerator.reuse_jpeg_as_coldpreview(image_bytes, coldpreview_size)
+            if coldpreview is None:
+                coldpreview = PreviewGenerator.generate_coldpreview_from_image(
+                    img,
+                    max_size=coldpreview_size
+                )
+            timings["coldpreview"] = (time.perf_counter() - start) * 1000
+    except ValueError as e:
+        # Image too small (< 4x4 pixels)
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid image: {str(e)}"
+        )
+    
+    return hotpreview, coldpreview
+
+
+def _multipart_parts(
+    boundary: str,
+    photo_json: bytes,
+    hotpreview: HotPreview,
+    coldpreview: Optional[ColdPreview]
+) -> Iterator[bytes]:
+    """
+    Yield a multipart/mixed body: photo JSON, hotpreview JPEG, coldpreview JPEG.
+    
+    Each part is named via Content-Disposition (photo, hotpreview, coldpreview).
+    The coldpreview part is omitted when no coldpreview was requested.
+    """
+    parts = [
+        ("photo", "application/json", photo_json),
+        ("hotpreview", "image/jpeg", hotpreview.bytes),
+    ]
+    if coldpreview is not None:
+        parts.append(("coldpreview", "image/jpeg", coldpreview.bytes))
+    
+    for name, content_type, body in parts:
+        yield (
+            f"--{boundary}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f'Content-Disposition: inline; name="{name}"\r\n'
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode()
+        yield body
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
+
+
+async def _process_image(
+    image_bytes: bytes,
+    filename: str,
+    coldpreview_size: Optional[int],
+    timings: Optional[Dict[str, float]] = None
+) -> ProcessingResult:
+    """
+    Wait for a processing slot, then decode image, extract metadata and
+    generate previews (see _process_image_in_slot).
+    
+    Stage durations (queue, decode, exif, hotpreview, coldpreview) are
+    recorded in timings if given. exif overlaps with the preview stages.
+    
+    Raises:
+        HTTPException 400: If the image cannot be decoded or is too small
+    """
+    if timings is None:
+        timings = {}
+    
+    start = time.perf_counter()
+    async with _limiter.slot():
+        timings["queue"] = (time.perf_counter() - start) * 1000
+        return await _process_image_in_slot(image_bytes, filename, coldpreview_size, timings)
+
+
+async def _process_image_in_slot(
+    image_bytes: bytes,
+    filename: str,
+    coldpreview_size: Optional[int],
+    timings: Dict[str, float]
+) -> ProcessingResult:
+    """
+    Decode image, extract metadata and generate previews.
+    
+    The caller must hold a processing slot. Decoding, EXIF parsing and JPEG
+    encoding are CPU-bound, so they run in worker threads to keep the event
+    loop serving other requests. Pillow releases the GIL while decoding and
+    encoding, so metadata extraction and preview generation overlap.
+    
+    Raises:
+        HTTPException 400: If the image cannot be decoded or is too small
+    """
+    img = await asyncio.to_thread(_timed, timings, "decode", _open_image, image_bytes, filename)
+    
+    (metadata, camera_settings), (hotpreview, coldpreview) = await asyncio.gather(
+        asyncio.to_thread(
+            _timed, timings, "exif", ExifExtractor.extract_all_from_bytes, image_bytes
+        ),
+        asyncio.to_thread(_generate_previews, img, image_bytes, coldpreview_size, timings),
+    )
+    
+    return metadata, camera_settings, hotpreview, coldpreview
+
+
+async def _finish_coldpreview(
+    token: str,
+    photo: PhotoCreateSchema,
+    image_bytes: bytes,
+    filename: str,
+    coldpreview_size: int,
+    cache_key: Optional[Tuple[Any, ...]],
+    partial: Tuple[BasicMetadata, CameraSettings, HotPreview]
+) -> None:
+    """
+    Background task: generate a deferred coldpreview and publish the complete photo.
+    
+    The image is decoded again rather than kept in memory while waiting
+    for a processing slot. Only the coldpreview is needed here, so JPEGs
+    are decoded at reduced scale (shrink-on-load) instead of full size.
+    """
+    try:
+        # Small JPEGs need no decode, so no slot either
+        coldpreview = await asyncio.to_thread(
+            PreviewGenerator.reuse_jpeg_as_coldpreview, image_bytes, coldpreview_size
+        )
+        if coldpreview is None:
+            async with _limiter.slot():
+                if RawProcessor.is_raw_file(filename):
+                    img = await asyncio.to_thread(_open_image, image_bytes, filename)
+                    coldpreview = await asyncio.to_thread(
+                        PreviewGenerator.generate_coldpreview_from_image,
+                        img,
+                        max_size=coldpreview_size
+                    )
+                else:
+                    coldpreview = await asyncio.to_thread(
+                        PreviewGenerator.generate_coldpreview_from_bytes,
+                        image_bytes,
+                        max_size=coldpreview_size
+                    )
+    except HTTPException as e:
+        _deferred_results.set(token, e)
+        return
+    except Exception as e:
+        _deferred_results.set(
+            token, HTTPException(status_code=400, detail=f"Invalid image: {str(e)}")
+        )
+        return
+    
+    metadata, camera_settings, hotpreview = partial
+    _result_cache.put(cache_key, (metadata, camera_settings, hotpreview, coldpreview))
+    _deferred_results.set(token, photo.model_copy(update={
+        "coldpreview_base64": coldpreview.base64,
+        "coldpreview_width": coldpreview.width,
+        "coldpreview_height": coldpreview.height,
+    }))
+
+
+def _build_photo(
+    result: ProcessingResult,
+    filename: str,
+    file_size: int,
+    content_type: str
+) -> PhotoCreateSchema:
+    """
+    Assemble a PhotoCreateSchema from a processing result and upload details.
+    """
+    metadata, camera_settings, hotpreview, coldpreview = result
+    
+    if coldpreview is not None:
+        coldpreview_base64 = coldpreview.base64
+        coldpreview_width = coldpreview.width
+        coldpreview_height = coldpreview.height
+    else:
+        coldpreview_base64 = None
+        coldpreview_width = None
+        coldpreview_height = None
+    
+    # Build exif_dict with all EXIF metadata (include None values for frontend display)
+    exif_dict: Dict[str, Any] = {
+        "camera_make": metadata.camera_make,
+        "camera_model": metadata.camera_model,
+        "iso": camera_settings.iso,
+        "aperture": camera_settings.aperture,
+        "shutter_speed": camera_settings.shutter_speed,
+        "focal_length": camera_settings.focal_length,
+        "lens_model": camera_settings.lens_model,
+        "lens_make": camera_settings.lens_make,
+        "flash": camera_settings.flash,
+        "exposure_program": camera_settings.exposure_program,
+        "metering_mode": camera_settings.metering_mode,
+        "white_balance": camera_settings.white_balance,
+        "gps_altitude": metadata.gps_altitude,
+        "gps_timestamp": metadata.gps_timestamp,
+        "gps_datestamp": metadata.gps_datestamp,
+        "gps_map_datum": metadata.gps_map_datum,
+    }
+    
+    # Build image_file_list
+    # All values below are produced by this service with the right types,
+    # so model_construct() skips redundant Pydantic validation.
+    image_file = ImageFileCreateSchema.model_construct(
+        filename=filename,
+        file_size=file_size,
+        format=content_type,
+        is_raw=False  # TODO: Detect RAW format
+    )
+    
+    # Add has_gps to exif_dict (convenience field)
+    has_gps = metadata.gps_latitude is not None and metadata.gps_longitude is not None
+    exif_dict["has_gps"] = has_gps
+    
+    # Build PhotoCreateSchema
+    # Note: metadata.taken_at is already ISO string from _standardize_datetime
+    return PhotoCreateSchema.model_construct(
+        hothash=hotpreview.hothash,
+        hotpreview_base64=hotpreview.base64,
+        hotpreview_width=hotpreview.width,
+        hotpreview_height=hotpreview.height,
+        coldpreview_base64=coldpreview_base64,
+        coldpreview_width=coldpreview_width,
+        coldpreview_height=coldpreview_height,
+        image_file_list=[image_file],
+        taken_at=metadata.taken_at,  # Already ISO string
+        width=metadata.width,
+        height=metadata.height,
+        gps_latitude=metadata.gps_latitude,
+        gps_longitude=metadata.gps_longitude,
+        exif_dict=exif_dict  # Always return dict (empty or with data)
+    )
+
+
+def _json_response(photo: PhotoCreateSchema, headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    Serialize a photo straight to JSON bytes with pydantic-core.
+    
+    Returning a Response bypasses FastAPI's response_model handling, which
+    (depending on FastAPI version) re-validates the model and serializes it
+    via jsonable_encoder + json.dumps - slow for multi-MB Base64 previews.
+    response_model is still declared on the routes for the OpenAPI schema.
+    """
+    return Response(
+        content=photo.model_dump_json(),
+        media_type="application/json",
+        headers=headers
+    )
+
+
+def _warm_up() -> None:
+    """
+    Run the processing pipeline once on a generated JPEG.
+    
+    Pillow registers format plugins and loads codecs lazily, so without
+    this the first real request after startup pays for it.
+    """
+    buffer = BytesIO()
+    Image.new("RGB", (64, 48), color="gray").save(buffer, format="JPEG")
+    image_bytes = buffer.getvalue()
+    
+    img = _open_image(image_bytes, "warmup.jpg")
+    ExifExtractor.extract_all_from_bytes(image_bytes)
+    PreviewGenerator.generate_hotpreview_from_image(img)
+    PreviewGenerator.generate_coldpreview_from_image(img, max_size=32)
+    PreviewGenerator.generate_coldpreview_from_bytes(image_bytes, max_size=32)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up image codecs before accepting requests."""
+    # In a worker thread, which also starts the pool used by asyncio.to_thread
+    await asyncio.to_thread(_warm_up)
+    yield
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="ImaLink Core API",
     description="Image processing service - converts images to PhotoCreateSchema JSON",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS - allow backend to call this service
@@ -35,12 +617,6 @@ app.add_middleware(
 )
 
 
-class ErrorResponse(BaseModel):
-    """Error response"""
-    error: str
-    detail: Optional[str] = None
-
-
 # API Endpoints
 @app.get("/")
 def root():
@@ -54,8 +630,20 @@ def root():
 
 @app.post("/v1/process", response_model=PhotoCreateSchema, responses={400: {"model": ErrorResponse}})
 async def process_image_endpoint(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="Image file to process"),
-    coldpreview_size: Optional[int] = Form(None, description="Size for coldpreview (e.g., 2560). None = skip coldpreview. Must be >= 150.")
+    coldpreview_size: Optional[int] = Form(None, description="Size for coldpreview (e.g., 2560). None = skip coldpreview. Must be >= 150."),
+    defer_coldpreview: bool = Form(
+        False,
+        description=(
+            "Return without coldpreview and generate it in the background. "
+            "Poll GET /v1/process/{token} (token in X-Coldpreview-Token header)."
+        )
+    ),
+    encoding: Literal["base64", "multipart"] = Query(
+        "base64",
+        description="Preview encoding: base64 (inline in JSON) or multipart (raw JPEG parts)"
+    )
 ):
     """
     Process uploaded image file and return PhotoCreateSchema JSON.
@@ -75,15 +663,32 @@ async def process_image_endpoint(
     PhotoCreateSchema optionally includes:
     - Coldpreview (larger preview) as Base64-encoded JPEG
     
+    With ?encoding=multipart the response is multipart/mixed instead: a JSON
+    part (PhotoCreateSchema without the *_base64 fields) followed by the raw
+    hotpreview and coldpreview JPEGs. This avoids the 33% Base64 overhead.
+    
+    With defer_coldpreview=true the response is returned as soon as the
+    hotpreview and metadata are ready, with coldpreview fields null. The
+    X-Coldpreview-Token header holds a token for GET /v1/process/{token},
+    which returns the complete photo once the coldpreview is generated.
+    
+    The Server-Timing header reports per-stage durations in ms (read, hash,
+    queue, decode, exif, hotpreview, coldpreview, total). Cache hits only
+    report read, hash and total.
+    
     Args:
         file: Uploaded image file (multipart/form-data)
         coldpreview_size: Optional size for coldpreview (form field)
+        defer_coldpreview: Generate coldpreview in the background (form field)
+        encoding: Preview encoding - "base64" (default) or "multipart" (query param)
         
     Returns:
         PhotoCreateSchema: Photo data JSON validated by Pydantic model
+        (or a multipart/mixed stream when encoding=multipart)
         
     Raises:
-        HTTPException 400: If file processing fails
+        HTTPException 400: If file processing fails, or defer_coldpreview is
+            requested while running more than one worker
         HTTPException 422: If validation fails (e.g., coldpreview_size < 150)
         
     Example:
@@ -98,135 +703,79 @@ async def process_image_endpoint(
             detail=f"coldpreview_size must be >= 150 (hotpreview size), got {coldpreview_size}"
         )
     
+    # Tokens live in this process - a poll could reach another worker
+    if defer_coldpreview and _workers > 1:
+        raise HTTPException(
+            status_code=400,
+            detail="defer_coldpreview requires a single worker (IMALINK_WORKERS=1)"
+        )
+    
+    # Requests waiting for a processing slot when this one arrived
+    response_headers = {"X-Queue-Depth": str(_limiter.waiting)}
+    # Per-stage durations in ms, reported in the Server-Timing header
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    
     try:
         # Read uploaded file into memory
         image_bytes = await file.read()
+        timings["read"] = (time.perf_counter() - start) * 1000
         
-        # Check if it's a RAW file and convert if needed
-        is_raw = RawProcessor.is_raw_file(file.filename or "")
+        filename = file.filename or ""
         
-        if is_raw:
-            # RAW file - convert to PIL Image using rawpy
-            if not RawProcessor.is_available():
-                raise HTTPException(
-                    status_code=400,
-                    detail="RAW file support not installed. Install with: uv pip install rawpy"
-                )
-            
-            success, img, error = RawProcessor.convert_raw_to_image(image_bytes)
-            if not success:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Failed to process RAW file: {error}"
+        cache_key = await _cache_key(image_bytes, filename, coldpreview_size, timings)
+        cached = _result_cache.get(cache_key)
+        defer = defer_coldpreview and coldpreview_size is not None and cached is None
+        
+        if cached is not None:
+            metadata, camera_settings, hotpreview, coldpreview = cached
+        elif defer:
+            metadata, camera_settings, hotpreview, coldpreview = await _process_image(
+                image_bytes, filename, None, timings
+            )
+            # Valid as-is for requests without coldpreview
+            if cache_key is not None:
+                _result_cache.put(
+                    cache_key[:2] + (None,),
+                    (metadata, camera_settings, hotpreview, coldpreview)
                 )
-            
-            # RAW is already converted to correct orientation, no EXIF transpose needed
-            
         else:
-            # Standard image format (JPEG, PNG, etc.) - validate and open
-            try:
-                img = Image.open(BytesIO(image_bytes))
-                img.verify()  # Check if it's a valid image
-            except Exception as e:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid image file: {str(e)}"
-                )
-            
-            # Re-open image for processing (verify() closes it) and apply EXIF rotation
-            img = Image.open(BytesIO(image_bytes))
-            try:
-                img = ImageOps.exif_transpose(img)  # Rotate based on EXIF orientation
-            except Exception:
-                pass  # No EXIF orientation or already correct
-        
-        # Extract metadata from bytes
-        metadata = ExifExtractor.extract_basic_from_bytes(image_bytes)
-        camera_settings = ExifExtractor.extract_camera_settings_from_bytes(image_bytes)
-        
-        # Generate hotpreview from image
-        try:
-            hotpreview = PreviewGenerator.generate_hotpreview_from_image(img)
-        except ValueError as e:
-            # Image too small (< 4x4 pixels)
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid image: {str(e)}"
+            metadata, camera_settings, hotpreview, coldpreview = await _process_image(
+                image_bytes, filename, coldpreview_size, timings
             )
+            _result_cache.put(cache_key, (metadata, camera_settings, hotpreview, coldpreview))
         
-        # Generate coldpreview (optional)
-        if coldpreview_size is not None:
-            try:
-                coldpreview = PreviewGenerator.generate_coldpreview_from_image(
-                    img,
-                    max_size=coldpreview_size
-                )
-                coldpreview_base64 = coldpreview.base64
-                coldpreview_width = coldpreview.width
-                coldpreview_height = coldpreview.height
-            except ValueError as e:
-                # Image too small (< 4x4 pixels)
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid image: {str(e)}"
-                )
-        else:
-            coldpreview_base64 = None
-            coldpreview_width = None
-            coldpreview_height = None
-        
-        # Build exif_dict with all EXIF metadata (include None values for frontend display)
-        exif_dict: Dict[str, Any] = {
-            "camera_make": metadata.camera_make,
-            "camera_model": metadata.camera_model,
-            "iso": camera_settings.iso,
-            "aperture": camera_settings.aperture,
-            "shutter_speed": camera_settings.shutter_speed,
-            "focal_length": camera_settings.focal_length,
-            "lens_model": camera_settings.lens_model,
-            "lens_make": camera_settings.lens_make,
-            "flash": camera_settings.flash,
-            "exposure_program": camera_settings.exposure_program,
-            "metering_mode": camera_settings.metering_mode,
-            "white_balance": camera_settings.white_balance,
-            "gps_altitude": metadata.gps_altitude,
-            "gps_timestamp": metadata.gps_timestamp,
-            "gps_datestamp": metadata.gps_datestamp,
-            "gps_map_datum": metadata.gps_map_datum,
-        }
-        
-        # Build image_file_list
-        image_file = ImageFileCreateSchema(
+        photo = _build_photo(
+            (metadata, camera_settings, hotpreview, coldpreview),
             filename=file.filename or "unknown.jpg",
             file_size=len(image_bytes),
-            format=file.content_type or "image/jpeg",
-            is_raw=False  # TODO: Detect RAW format
-        )
-        
-        # Add has_gps to exif_dict (convenience field)
-        has_gps = metadata.gps_latitude is not None and metadata.gps_longitude is not None
-        exif_dict["has_gps"] = has_gps
-        
-        # Build PhotoCreateSchema
-        # Note: metadata.taken_at is already ISO string from _standardize_datetime
-        photo = PhotoCreateSchema(
-            hothash=hotpreview.hothash,
-            hotpreview_base64=hotpreview.base64,
-            hotpreview_width=hotpreview.width,
-            hotpreview_height=hotpreview.height,
-            coldpreview_base64=coldpreview_base64,
-            coldpreview_width=coldpreview_width,
-            coldpreview_height=coldpreview_height,
-            image_file_list=[image_file],
-            taken_at=metadata.taken_at,  # Already ISO string
-            width=metadata.width,
-            height=metadata.height,
-            gps_latitude=metadata.gps_latitude,
-            gps_longitude=metadata.gps_longitude,
-            exif_dict=exif_dict  # Always return dict (empty or with data)
-        )
-        
-        return photo
+            content_type=file.content_type or "image/jpeg"
+        )
+        
+        if defer:
+            token = _deferred_results.create()
+            background_tasks.add_task(
+                _finish_coldpreview,
+                token, photo, image_bytes, filename, coldpreview_size, cache_key,
+                (metadata, camera_settings, hotpreview)
+            )
+            response_headers["X-Coldpreview-Token"] = token
+        
+        timings["total"] = (time.perf_counter() - start) * 1000
+        response_headers["Server-Timing"] = _server_timing(timings)
+        
+        if encoding == "multipart":
+            boundary = uuid.uuid4().hex
+            photo_json = photo.model_dump_json(
+                exclude={"hotpreview_base64", "coldpreview_base64"}
+            ).encode()
+            return StreamingResponse(
+                _multipart_parts(boundary, photo_json, hotpreview, coldpreview),
+                media_type=f"multipart/mixed; boundary={boundary}",
+                headers=response_headers
+            )
+        
+        return _json_response(photo, headers=response_headers)
     
     except Exception as e:
         raise HTTPException(
@@ -235,6 +784,161 @@ async def process_image_endpoint(
         )
 
 
+async def _process_batch_item(
+    index: int,
+    file: UploadFile,
+    coldpreview_size: Optional[int]
+) -> BatchItemResult:
+    """
+    Process one file of a batch. Failures are reported in the result, not raised.
+    
+    The processing slot is taken before the upload is read, so only files
+    holding a slot are in memory and slots are granted in task creation order.
+    """
+    filename = file.filename or "unknown.jpg"
+    try:
+        async with _limiter.slot():
+            image_bytes = await file.read()
+            cache_key = await _cache_key(image_bytes, filename, coldpreview_size, {})
+            result = _result_cache.get(cache_key)
+            if result is None:
+                result = await _process_image_in_slot(
+                    image_bytes, file.filename or "", coldpreview_size, {}
+                )
+                _result_cache.put(cache_key, result)
+        
+        photo = _build_photo(
+            result,
+            filename=filename,
+            file_size=len(image_bytes),
+            content_type=file.content_type or "image/jpeg"
+        )
+        return BatchItemResult.model_construct(
+            index=index, filename=filename, photo=photo, error=None
+        )
+    except HTTPException as e:
+        return BatchItemResult.model_construct(
+            index=index, filename=filename, photo=None, error=e.detail
+        )
+    except Exception as e:
+        return BatchItemResult.model_construct(
+            index=index, filename=filename, photo=None, error=f"Processing failed: {str(e)}"
+        )
+
+
+async def _batch_lines(
+    files: List[UploadFile],
+    coldpreview_size: Optional[int]
+) -> AsyncIterator[bytes]:
+    """
+    Yield one NDJSON line per file, in completion order.
+    
+    Largest files get processing slots first so a big image queued last
+    does not leave the other slots idle at the end of the batch.
+    """
+    order = sorted(range(len(files)), key=lambda i: files[i].size or 0, reverse=True)
+    tasks = [
+        asyncio.ensure_future(_process_batch_item(i, files[i], coldpreview_size))
+        for i in order
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            item = await next_done
+            yield item.model_dump_json().encode() + b"\n"
+    finally:
+        # Client disconnected mid-stream - don't keep processing for nobody
+        for task in tasks:
+            task.cancel()
+
+
+@app.post("/v1/process_batch", responses={400: {"model": ErrorResponse}})
+async def process_batch_endpoint(
+    files: List[UploadFile] = File(..., description="Image files to process"),
+    coldpreview_size: Optional[int] = Form(
+        None,
+        description="Size for coldpreview (e.g., 2560). None = skip coldpreview. Must be >= 150."
+    )
+):
+    """
+    Process several uploaded images in one request.
+    
+    Saves a round-trip and request parsing per photo when importing a
+    folder. Files share the service's processing slots and result cache
+    with /v1/process.
+    
+    The response is streamed as NDJSON (application/x-ndjson): one
+    BatchItemResult line per file as soon as it is done, so lines arrive
+    in completion order, not upload order. Use "index" to match a line to
+    its file. A file that fails gets a line with "error" set instead of
+    "photo"; the rest of the batch is unaffected.
+    
+    Args:
+        files: Uploaded image files (multipart/form-data, repeated "files" field)
+        coldpreview_size: Optional size for coldpreview, applied to all files
+        
+    Returns:
+        StreamingResponse: NDJSON stream of BatchItemResult
+        
+    Raises:
+        HTTPException 400: If coldpreview_size < 150 or there are more than
+            IMALINK_MAX_BATCH_FILES files
+        
+    Example:
+        curl -X POST http://localhost:8765/v1/process_batch \\
+          -F "files=@a.jpg" -F "files=@b.jpg" \\
+          -F "coldpreview_size=1024"
+    """
+    if coldpreview_size is not None and coldpreview_size < 150:
+        raise HTTPException(
+            status_code=400,
+            detail=f"coldpreview_size must be >= 150 (hotpreview size), got {coldpreview_size}"
+        )
+    if len(files) > _max_batch_files:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {_max_batch_files} files per batch, got {len(files)}"
+        )
+    
+    return StreamingResponse(
+        _batch_lines(files, coldpreview_size),
+        media_type="application/x-ndjson"
+    )
+
+
+@app.get(
+    "/v1/process/{token}",
+    response_model=PhotoCreateSchema,
+    responses={
+        202: {"description": "Coldpreview still being generated"},
+        404: {"model": ErrorResponse},
+    }
+)
+async def deferred_result_endpoint(token: str):
+    """
+    Get a photo whose coldpreview was deferred (defer_coldpreview=true).
+    
+    Returns 202 while the coldpreview is being generated, then the complete
+    PhotoCreateSchema including coldpreview. Clients should poll with
+    increasing intervals (e.g., start at 100 ms, double up to 2 s).
+    
+    The result can be collected once: the token is invalid afterwards.
+    
+    Raises:
+        HTTPException 404: Unknown, expired or already collected token
+        HTTPException 400: Coldpreview generation failed
+    """
+    try:
+        result = _deferred_results.pop(token)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired token: {token}")
+    
+    if result is None:
+        return JSONResponse(status_code=202, content={"status": "pending"})
+    if isinstance(result, HTTPException):
+        raise result
+    return _json_response(result)
+
+
 @app.get("/health")
 def health_check():
     """Health check endpoint for monitoring"""
@@ -243,4 +947,16 @@ def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8765)
+    
+    # Production entry point: uvloop event loop and httptools parser (both
+    # from uvicorn[standard]), no access log. A single worker unless
+    # IMALINK_WORKERS opts in to more - deferred coldpreviews need one.
+    uvicorn.run(
+        "service.main:app",  # Import string - required for multiple workers
+        host="0.0.0.0",
+        port=8765,
+        workers=_workers,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
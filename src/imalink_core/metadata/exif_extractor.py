@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import BinaryIO, Optional, Tuple
 
 from PIL import Image
 from PIL.ExifTags import TAGS, GPSTAGS
@@ -79,6 +79,8 @@ class CameraSettings:
 class ExifExtractor:
     """Extracts EXIF metadata from images"""
     
+    JPEG_MAGIC = b'\xff\xd8'
+    
     @staticmethod
     def extract_basic(image_path: Path) -> BasicMetadata:
         """
@@ -142,46 +144,12 @@ class ExifExtractor:
         Returns:
             BasicMetadata object with core metadata
         """
-        result = BasicMetadata()
-        
         try:
             with Image.open(BytesIO(image_bytes)) as img:
-                # Get dimensions
-                result.width, result.height = img.size
-                
-                # Get EXIF data
-                exif = img.getexif()
-                if not exif:
-                    return result
-                
-                # Extract timestamp (98%+ reliable)
-                for datetime_tag in [36867, 36868, 306]:  # DateTimeOriginal, DateTimeDigitized, DateTime
-                    if datetime_tag in exif:
-                        dt_str = exif[datetime_tag]
-                        if dt_str:
-                            result.taken_at = ExifExtractor._standardize_datetime(dt_str)
-                            break
-                
-                # Extract camera make/model
-                if 271 in exif:  # Make
-                    result.camera_make = str(exif[271]).strip()
-                if 272 in exif:  # Model
-                    result.camera_model = str(exif[272]).strip()
-                
-                # Extract GPS data (98%+ reliable if present)
-                lat, lon, alt, ts, ds, datum = ExifExtractor._extract_gps_from_exif(exif)
-                result.gps_latitude = lat
-                result.gps_longitude = lon
-                result.gps_altitude = alt
-                result.gps_timestamp = ts
-                result.gps_datestamp = ds
-                result.gps_map_datum = datum
-                
-        except Exception as e:
-            # Silent failure - return partial data
-            pass
-        
-        return result
+                return ExifExtractor._parse_basic(img, ExifExtractor._read_exif(img))
+        except Exception:
+            # Silent failure - return empty metadata
+            return BasicMetadata()
     
     @staticmethod
     def extract_camera_settings(image_path: Path) -> CameraSettings:
@@ -294,81 +262,249 @@ class ExifExtractor:
         Returns:
             CameraSettings object with available settings
         """
-        result = CameraSettings()
+        try:
+            with Image.open(BytesIO(image_bytes)) as img:
+                return ExifExtractor._parse_camera_settings(ExifExtractor._read_exif(img))
+        except Exception:
+            # Silent failure - return empty settings
+            return CameraSettings()
+    
+    @staticmethod
+    def extract_all(image_path: Path) -> Tuple[BasicMetadata, CameraSettings]:
+        """
+        Extract basic metadata and camera settings in a single pass.
         
+        Opens the file once and parses the EXIF block once. For JPEG files
+        only the header segments (everything before the compressed image
+        data) are read, so multi-MB files cost a few KB of I/O.
+        Other formats are read in full.
+        
+        Args:
+            image_path: Path to image file
+            
+        Returns:
+            Tuple of (BasicMetadata, CameraSettings)
+        """
+        try:
+            with open(image_path, 'rb') as f:
+                if f.read(2) == ExifExtractor.JPEG_MAGIC:
+                    header_size = ExifExtractor._jpeg_header_size(f)
+                    if header_size is not None:
+                        f.seek(0)
+                        try:
+                            with Image.open(BytesIO(f.read(header_size))) as img:
+                                return ExifExtractor._parse_all(img)
+                        except Exception:
+                            pass  # Unusual layout - fall back to reading everything
+                f.seek(0)
+                image_bytes = f.read()
+        except OSError:
+            return BasicMetadata(), CameraSettings()
+        
+        return ExifExtractor.extract_all_from_bytes(image_bytes)
+    
+    @staticmethod
+    def extract_all_from_bytes(image_bytes: bytes) -> Tuple[BasicMetadata, CameraSettings]:
+        """
+        Extract basic metadata and camera settings from image bytes in a single pass.
+        
+        Equivalent to calling extract_basic_from_bytes() and
+        extract_camera_settings_from_bytes(), but decodes the image header
+        and parses EXIF only once.
+        
+        Args:
+            image_bytes: Raw image file bytes (for JPEG, the header segments are enough)
+            
+        Returns:
+            Tuple of (BasicMetadata, CameraSettings)
+        """
         try:
             with Image.open(BytesIO(image_bytes)) as img:
-                exif = img.getexif()
-                if not exif:
-                    return result
-                
-                # Try to get EXIF IFD (most camera settings are here)
-                try:
-                    exif_ifd = exif.get_ifd(0x8769)  # EXIF IFD
-                    # Merge EXIF IFD into main exif dict for easier access
-                    for tag_id, value in exif_ifd.items():
-                        if tag_id not in exif:
-                            exif[tag_id] = value
-                except (KeyError, AttributeError):
-                    pass  # No EXIF IFD, continue with main EXIF
-                
-                # ISO (80-90% reliable)
-                if 34855 in exif:  # ISOSpeedRatings
-                    result.iso = int(exif[34855])
-                
-                # Aperture (85-90% reliable)
-                if 33437 in exif:  # FNumber
-                    result.aperture = float(exif[33437])
-                
-                # Shutter speed (85-90% reliable)
-                if 33434 in exif:  # ExposureTime
-                    exp_time = exif[33434]
-                    exp_float = float(exp_time)  # Convert any type to float
-                    # Convert decimal to fraction string for better readability
-                    if exp_float < 1:
-                        result.shutter_speed = f"1/{int(round(1/exp_float))}"
-                    else:
-                        result.shutter_speed = f"{exp_float:.3f}"
-                
-                # Focal length (80-85% reliable)
-                if 37386 in exif:  # FocalLength
-                    focal = exif[37386]
-                    result.focal_length = float(focal)
-                
-                # Lens info (60-70% reliable)
-                if 42036 in exif:  # LensModel
-                    result.lens_model = exif[42036]
-                if 42035 in exif:  # LensMake
-                    result.lens_make = exif[42035]
-                
-                # Flash (75%+ reliable)
-                if 37385 in exif:  # Flash
-                    flash_val = exif[37385]
-                    result.flash = 'Fired' if (flash_val & 1) else 'No Flash'
-                
-                # Exposure program (70%+ reliable)
-                if 34850 in exif:  # ExposureProgram
-                    programs = {
-                        0: 'Not Defined', 1: 'Manual', 2: 'Program AE', 
-                        3: 'Aperture Priority', 4: 'Shutter Priority',
-                        5: 'Creative (Slow Speed)', 6: 'Action (High Speed)',
-                        7: 'Portrait', 8: 'Landscape'
-                    }
-                    result.exposure_program = programs.get(exif[34850], 'Unknown')
-                
-                # Metering mode (70%+ reliable)
-                if 37383 in exif:  # MeteringMode
-                    metering = {
-                        0: 'Unknown', 1: 'Average', 2: 'Center Weighted Average',
-                        3: 'Spot', 4: 'Multi-Spot', 5: 'Multi-Segment', 6: 'Partial'
-                    }
-                    result.metering_mode = metering.get(exif[37383], 'Unknown')
+                return ExifExtractor._parse_all(img)
+        except Exception:
+            # Silent failure - return empty metadata
+            return BasicMetadata(), CameraSettings()
+    
+    @staticmethod
+    def _jpeg_header_size(f: BinaryIO) -> Optional[int]:
+        """
+        Find where a JPEG's compressed image data starts by walking segment markers.
+        
+        Only the 4-byte marker/length prefix of each segment is read.
+        
+        Args:
+            f: Binary file object positioned anywhere (JPEG assumed)
+            
+        Returns:
+            Byte offset just past the start-of-scan header, or None if the
+            marker structure is not recognised
+        """
+        offset = 2  # Skip SOI marker
+        while True:
+            f.seek(offset)
+            segment = f.read(4)
+            if len(segment) < 4 or segment[0] != 0xFF:
+                return None
+            if segment[1] == 0xFF:  # Fill byte before marker
+                offset += 1
+                continue
+            offset += 2 + int.from_bytes(segment[2:4], 'big')
+            if segment[1] == 0xDA:  # Start of scan - image data follows
+                return offset
+    
+    @staticmethod
+    def _parse_all(img: Image.Image) -> Tuple[BasicMetadata, CameraSettings]:
+        """Parse both metadata tiers from an opened image, reading EXIF once."""
+        exif = ExifExtractor._read_exif(img)
+        # Basic first: camera settings merges the EXIF IFD into the shared dict
+        metadata = ExifExtractor._parse_basic(img, exif)
+        camera_settings = ExifExtractor._parse_camera_settings(exif)
+        return metadata, camera_settings
+    
+    @staticmethod
+    def _read_exif(img: Image.Image) -> Optional[Image.Exif]:
+        """
+        Get EXIF from an opened image without decoding pixel data.
+        
+        Pillow's PNG getexif() loads the entire image looking for a trailing
+        eXIf chunk. Skip it unless the chunk was already seen in the header.
+        
+        Returns:
+            Exif object, or None if unavailable or unreadable
+        """
+        if img.format == "PNG" and "exif" not in img.info:
+            return None
+        try:
+            return img.getexif()
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _parse_basic(img: Image.Image, exif: Optional[Image.Exif]) -> BasicMetadata:
+        """
+        Build BasicMetadata from an opened image and its EXIF.
+        
+        Returns partial data if parsing fails midway.
+        """
+        result = BasicMetadata()
+        
+        try:
+            # Get dimensions
+            result.width, result.height = img.size
+            
+            if not exif:
+                return result
+            
+            # Extract timestamp (98%+ reliable)
+            for datetime_tag in [36867, 36868, 306]:  # DateTimeOriginal, DateTimeDigitized, DateTime
+                if datetime_tag in exif:
+                    dt_str = exif[datetime_tag]
+                    if dt_str:
+                        result.taken_at = ExifExtractor._standardize_datetime(dt_str)
+                        break
+            
+            # Extract camera make/model
+            if 271 in exif:  # Make
+                result.camera_make = str(exif[271]).strip()
+            if 272 in exif:  # Model
+                result.camera_model = str(exif[272]).strip()
+            
+            # Extract GPS data (98%+ reliable if present)
+            lat, lon, alt, ts, ds, datum = ExifExtractor._extract_gps_from_exif(exif)
+            result.gps_latitude = lat
+            result.gps_longitude = lon
+            result.gps_altitude = alt
+            result.gps_timestamp = ts
+            result.gps_datestamp = ds
+            result.gps_map_datum = datum
+            
+        except Exception as e:
+            # Silent failure - return partial data
+            pass
+        
+        return result
+    
+    @staticmethod
+    def _parse_camera_settings(exif: Optional[Image.Exif]) -> CameraSettings:
+        """
+        Build CameraSettings from EXIF (best-effort).
+        
+        Note: merges the EXIF IFD into the given exif object.
+        Returns partial data if parsing fails midway.
+        """
+        result = CameraSettings()
+        
+        try:
+            if not exif:
+                return result
+            
+            # Try to get EXIF IFD (most camera settings are here)
+            try:
+                exif_ifd = exif.get_ifd(0x8769)  # EXIF IFD
+                # Merge EXIF IFD into main exif dict for easier access
+                for tag_id, value in exif_ifd.items():
+                    if tag_id not in exif:
+                        exif[tag_id] = value
+            except (KeyError, AttributeError):
+                pass  # No EXIF IFD, continue with main EXIF
+            
+            # ISO (80-90% reliable)
+            if 34855 in exif:  # ISOSpeedRatings
+                result.iso = int(exif[34855])
+            
+            # Aperture (85-90% reliable)
+            if 33437 in exif:  # FNumber
+                result.aperture = float(exif[33437])
+            
+            # Shutter speed (85-90% reliable)
+            if 33434 in exif:  # ExposureTime
+                exp_time = exif[33434]
+                exp_float = float(exp_time)  # Convert any type to float
+                # Convert decimal to fraction string for better readability
+                if exp_float < 1:
+                    result.shutter_speed = f"1/{int(round(1/exp_float))}"
+                else:
+                    result.shutter_speed = f"{exp_float:.3f}"
+            
+            # Focal length (80-85% reliable)
+            if 37386 in exif:  # FocalLength
+                focal = exif[37386]
+                result.focal_length = float(focal)
+            
+            # Lens info (60-70% reliable)
+            if 42036 in exif:  # LensModel
+                result.lens_model = exif[42036]
+            if 42035 in exif:  # LensMake
+                result.lens_make = exif[42035]
+            
+            # Flash (75%+ reliable)
+            if 37385 in exif:  # Flash
+                flash_val = exif[37385]
+                result.flash = 'Fired' if (flash_val & 1) else 'No Flash'
+            
+            # Exposure program (70%+ reliable)
+            if 34850 in exif:  # ExposureProgram
+                programs = {
+                    0: 'Not Defined', 1: 'Manual', 2: 'Program AE', 
+                    3: 'Aperture Priority', 4: 'Shutter Priority',
+                    5: 'Creative (Slow Speed)', 6: 'Action (High Speed)',
+                    7: 'Portrait', 8: 'Landscape'
+                }
+                result.exposure_program = programs.get(exif[34850], 'Unknown')
+            
+            # Metering mode (70%+ reliable)
+            if 37383 in exif:  # MeteringMode
+                metering = {
+                    0: 'Unknown', 1: 'Average', 2: 'Center Weighted Average',
+                    3: 'Spot', 4: 'Multi-Spot', 5: 'Multi-Segment', 6: 'Partial'
+                }
+                result.metering_mode = metering.get(exif[37383], 'Unknown')
+            
+            # White balance (70%+ reliable)
+            if 41987 in exif:  # WhiteBalance
+                wb = exif[41987]
+                result.white_balance = 'Auto' if wb == 0 else 'Manual'
                 
-                # White balance (70%+ reliable)
-                if 41987 in exif:  # WhiteBalance
-                    wb = exif[41987]
-                    result.white_balance = 'Auto' if wb == 0 else 'Manual'
-                    
         except Exception as e:
             # Silent failure - return partial data
             pass
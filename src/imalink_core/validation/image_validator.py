@@ -4,6 +4,7 @@ Image Validation Module
 Validates image files before processing.
 """
 
+import stat
 from pathlib import Path
 from typing import Tuple, Optional
 
@@ -37,18 +38,20 @@ class ImageValidator:
         Returns:
             (is_valid, error_message) tuple
         """
-        # Check file exists
-        if not file_path.exists():
+        # Check file exists, is a regular file, and get its size - one stat() call
+        # (exists() + is_file() + stat() each hit the filesystem, which is
+        # slow on network shares)
+        try:
+            file_stat = file_path.stat()
+        except FileNotFoundError:
             return False, f"File not found: {file_path}"
+        except OSError as e:
+            return False, f"Cannot access file: {e}"
         
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             return False, f"Not a file: {file_path}"
         
-        # Check file size
-        try:
-            size = file_path.stat().st_size
-        except OSError as e:
-            return False, f"Cannot access file: {e}"
+        size = file_stat.st_size
         
         if size > ImageValidator.MAX_FILE_SIZE:
             size_mb = size / 1024 / 1024
@@ -0,0 +1,102 @@
+"""
+Shared pytest fixtures and helpers
+"""
+
+import pytest
+from pathlib import Path
+from imalink_core.metadata.exif_extractor import ExifExtractor
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "images"
+
+
+def print_exif_report(camera_name: str, image_bytes: bytes) -> dict:
+    """Generate detailed EXIF extraction report"""
+    print(f"\n{'='*70}")
+    print(f"CAMERA: {camera_name}")
+    print('='*70)
+    
+    # Extract all metadata
+    basic, camera = ExifExtractor.extract_all_from_bytes(image_bytes)
+    
+    # Camera info
+    print(f"\n📷 CAMERA INFO:")
+    print(f"  Make: {basic.camera_make or '❌ MISSING'}")
+    print(f"  Model: {basic.camera_model or '❌ MISSING'}")
+    
+    # Camera settings
+    print(f"\n⚙️  CAMERA SETTINGS:")
+    settings = {
+        "ISO": camera.iso,
+        "Aperture": f"f/{camera.aperture}" if camera.aperture else None,
+        "Shutter": camera.shutter_speed,
+        "Focal Length": f"{camera.focal_length}mm" if camera.focal_length else None,
+        "Lens Model": camera.lens_model,
+        "Lens Make": camera.lens_make,
+        "Flash": camera.flash,
+        "Exposure Program": camera.exposure_program,
+        "Metering Mode": camera.metering_mode,
+        "White Balance": camera.white_balance,
+    }
+    
+    settings_found = 0
+    for name, value in settings.items():
+        status = "✅" if value else "❌"
+        display_value = value if value else "MISSING"
+        print(f"  {status} {name}: {display_value}")
+        if value:
+            settings_found += 1
+    
+    # GPS data
+    print(f"\n🌍 GPS DATA:")
+    gps_fields = {
+        "Latitude": basic.gps_latitude,
+        "Longitude": basic.gps_longitude,
+        "Altitude": f"{basic.gps_altitude}m" if basic.gps_altitude else None,
+        "Timestamp": basic.gps_timestamp,
+        "Datestamp": basic.gps_datestamp,
+        "Map Datum": basic.gps_map_datum,
+    }
+    
+    gps_found = 0
+    for name, value in gps_fields.items():
+        status = "✅" if value else "❌"
+        display_value = value if value else "MISSING"
+        print(f"  {status} {name}: {display_value}")
+        if value:
+            gps_found += 1
+    
+    # Metadata quality
+    print(f"\n📊 METADATA QUALITY:")
+    print(f"  Dimensions: {basic.width}x{basic.height}")
+    print(f"  Taken at: {basic.taken_at or '❌ MISSING'}")
+    print(f"  Camera Settings: {settings_found}/10 fields")
+    print(f"  GPS Data: {gps_found}/6 fields")
+    
+    total_fields = 2 + settings_found + gps_found  # camera_make + camera_model + settings + gps
+    print(f"\n  ✅ TOTAL: {total_fields}/18 EXIF fields extracted")
+    print('='*70)
+    
+    return {
+        "camera_make": basic.camera_make,
+        "camera_model": basic.camera_model,
+        "settings_found": settings_found,
+        "gps_found": gps_found,
+        "total_fields": total_fields,
+    }
+
+
+@pytest.fixture(scope="session")
+def image_bytes_cache() -> dict:
+    """Bytes of every fixture image, read once per test session"""
+    return {
+        path.name: path.read_bytes()
+        for path in FIXTURES_DIR.iterdir()
+        if path.suffix.lower() in {".jpg", ".jpeg", ".png"}
+    }
+
+
+@pytest.fixture
+def exif_report():
+    """EXIF extraction report printer (see print_exif_report)"""
+    return print_exif_report
@@ -7,6 +7,7 @@ Tests the two-tier extraction system:
 """
 
 import pytest
+from io import BytesIO
 from pathlib import Path
 from imalink_core.metadata.exif_extractor import ExifExtractor
 
@@ -189,3 +190,40 @@ class TestTimestampParsing:
         
         assert metadata.taken_at is not None
         assert "2008" in metadata.taken_at
+
+
+class TestSinglePassExtraction:
+    """Test combined single-pass extraction (extract_all)"""
+    
+    @pytest.mark.parametrize("filename", [
+        "Canon_40D.jpg", "gps_sample.jpg", "fuji_full_exif.jpg",
+        "sony_xperia.jpg", "jpeg_no_exif.jpg", "png_basic.png",
+    ])
+    def test_matches_separate_extractors(self, filename):
+        """Should return the same data as the separate bytes extractors"""
+        image_bytes = (FIXTURES_DIR / filename).read_bytes()
+        
+        metadata, camera_settings = ExifExtractor.extract_all(FIXTURES_DIR / filename)
+        
+        assert metadata == ExifExtractor.extract_basic_from_bytes(image_bytes)
+        assert camera_settings == ExifExtractor.extract_camera_settings_from_bytes(image_bytes)
+    
+    def test_from_bytes_header_only(self):
+        """Should extract everything from the JPEG header segments alone"""
+        image_bytes = (FIXTURES_DIR / "sony_xperia.jpg").read_bytes()  # ~2 MB
+        header_size = ExifExtractor._jpeg_header_size(BytesIO(image_bytes))
+        header = image_bytes[:header_size]
+        assert len(header) < len(image_bytes) // 5
+        
+        metadata, camera_settings = ExifExtractor.extract_all_from_bytes(header)
+        
+        assert metadata.camera_make == "Sony"
+        assert metadata == ExifExtractor.extract_basic_from_bytes(image_bytes)
+        assert camera_settings == ExifExtractor.extract_camera_settings_from_bytes(image_bytes)
+    
+    def test_extract_from_nonexistent_file(self):
+        """Should return empty metadata for nonexistent file"""
+        metadata, camera_settings = ExifExtractor.extract_all(Path("nonexistent.jpg"))
+        
+        assert metadata.width is None
+        assert camera_settings.iso is None
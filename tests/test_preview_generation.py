@@ -126,7 +126,81 @@ class TestColdpreviewGeneration:
         # Should fit within custom size
         assert coldpreview.width <= 1024
         assert coldpreview.height <= 1024
-
+    
+    def test_coldpreview_downscaled_rotated_jpeg(self):
+        """Should match from_image dimensions when downscaling a rotated large JPEG"""
+        from PIL import Image, ImageOps
+        
+        file_path = FIXTURES_DIR / "sony_xperia.jpg"  # 4032x2688, orientation 6
+        coldpreview = PreviewGenerator.generate_coldpreview(file_path, max_size=1024)
+        
+        img = ImageOps.exif_transpose(Image.open(file_path))
+        reference = PreviewGenerator.generate_coldpreview_from_image(img, max_size=1024)
+        
+        # Portrait after rotation
+        assert (coldpreview.width, coldpreview.height) == (683, 1024)
+        assert (coldpreview.width, coldpreview.height) == (reference.width, reference.height)
+    
+    def test_coldpreview_extreme_aspect_ratio(self, tmp_path):
+        """Should downscale a very wide JPEG whose scaled height rounds to 0"""
+        from PIL import Image
+        
+        file_path = tmp_path / "strip.jpg"
+        Image.new("RGB", (4000, 8), color="white").save(file_path, format="JPEG")
+        
+        coldpreview = PreviewGenerator.generate_coldpreview(file_path, max_size=300)
+        
+        assert (coldpreview.width, coldpreview.height) == (300, 1)
+    
+    def test_coldpreview_from_bytes_matches_path(self):
+        """Bytes variant should shrink on load and match the path-based coldpreview"""
+        file_path = FIXTURES_DIR / "sony_xperia.jpg"  # 4032x2688, orientation 6
+        
+        from_bytes = PreviewGenerator.generate_coldpreview_from_bytes(
+            file_path.read_bytes(), max_size=1024
+        )
+        from_path = PreviewGenerator.generate_coldpreview(file_path, max_size=1024)
+        
+        assert (from_bytes.width, from_bytes.height) == (683, 1024)
+        assert from_bytes.bytes == from_path.bytes
+    
+    def test_reuse_small_jpeg_as_coldpreview(self):
+        """Should reuse a JPEG that already fits, with identical pixels and no EXIF"""
+        from io import BytesIO
+        from PIL import Image
+        
+        image_bytes = (FIXTURES_DIR / "jpeg_gps.jpg").read_bytes()  # 800x600, has EXIF/GPS
+        coldpreview = PreviewGenerator.reuse_jpeg_as_coldpreview(image_bytes, max_size=1024)
+        
+        assert coldpreview is not None
+        assert (coldpreview.width, coldpreview.height) == (800, 600)
+        assert base64.b64decode(coldpreview.base64) == coldpreview.bytes
+        
+        reused = Image.open(BytesIO(coldpreview.bytes))
+        assert not reused.getexif()
+        assert reused.tobytes() == Image.open(BytesIO(image_bytes)).tobytes()
+    
+    def test_strip_jpeg_metadata_keeps_icc(self):
+        """Stripping should drop EXIF but keep the ICC profile"""
+        from io import BytesIO
+        from PIL import Image
+        
+        image_bytes = (FIXTURES_DIR / "Canon_40D.jpg").read_bytes()  # EXIF + ICC
+        stripped = PreviewGenerator._strip_jpeg_metadata(image_bytes)
+        
+        with Image.open(BytesIO(stripped)) as img:
+            assert not img.getexif()
+            assert img.info["icc_profile"] == Image.open(BytesIO(image_bytes)).info["icc_profile"]
+    
+    def test_reuse_requires_fitting_unrotated_jpeg(self):
+        """Should decline images that need resizing, rotation or are not JPEG"""
+        landscape = (FIXTURES_DIR / "jpeg_landscape.jpg").read_bytes()  # 1200x800
+        rotated = (FIXTURES_DIR / "jpeg_rotated.jpg").read_bytes()  # orientation 6
+        png = (FIXTURES_DIR / "png_basic.png").read_bytes()
+        
+        assert PreviewGenerator.reuse_jpeg_as_coldpreview(landscape, max_size=1024) is None
+        assert PreviewGenerator.reuse_jpeg_as_coldpreview(rotated, max_size=1024) is None
+        assert PreviewGenerator.reuse_jpeg_as_coldpreview(png, max_size=1024) is None
 
 class TestHothashCalculation:
     """Test hothash (SHA256) calculation"""
@@ -215,6 +289,18 @@ class TestBothPreviewGeneration:
         
         assert hotpreview.width <= 150
         assert coldpreview.width == 1200  # Original size (within max size)
+    
+    def test_both_previews_match_separate_generation(self):
+        """Single-decode generate_both must give the same hothash as generate_hotpreview"""
+        file_path = FIXTURES_DIR / "jpeg_rotated.jpg"  # EXIF orientation 6
+        hotpreview, coldpreview = PreviewGenerator.generate_both(file_path)
+        
+        separate_hot = PreviewGenerator.generate_hotpreview(file_path)
+        separate_cold = PreviewGenerator.generate_coldpreview(file_path)
+        
+        assert hotpreview.hothash == separate_hot.hothash
+        assert coldpreview.width == separate_cold.width
+        assert coldpreview.height == separate_cold.height
 
 
 class TestPreviewQuality:
@@ -233,6 +319,21 @@ class TestPreviewQuality:
         
         # But hothash should be different (different JPEG compression)
         assert high_quality.hothash != low_quality.hothash
+    
+    def test_coldpreview_encoding(self):
+        """Coldpreview should be progressive JPEG without EXIF or ICC profile"""
+        # Re-encoded coldpreviews only - a reused small JPEG keeps the source's
+        # ICC profile and encoding (see test_reuse_small_jpeg_as_coldpreview)
+        from io import BytesIO
+        from PIL import Image
+        
+        file_path = FIXTURES_DIR / "sony_xperia.jpg"  # Source has full EXIF
+        coldpreview = PreviewGenerator.generate_coldpreview(file_path, max_size=1024)
+        
+        with Image.open(BytesIO(coldpreview.bytes)) as img:
+            assert img.info.get("progressive")
+            assert "exif" not in img.info
+            assert "icc_profile" not in img.info
 
 
 class TestImageSizeValidation:
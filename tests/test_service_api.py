@@ -184,6 +184,188 @@ class TestProcessEndpoint:
         assert photo_data2["image_file_list"][0]["filename"] == "test2.jpg"
 
 
+class TestResultCache:
+    """Test that repeated uploads are served from the result cache."""
+
+    def test_repeat_upload_uses_cache(self):
+        """Second upload of the same bytes returns identical data from cache."""
+        from main import _result_cache
+        
+        image_bytes = (FIXTURES_DIR / "jpeg_landscape.jpg").read_bytes()
+        
+        response1 = client.post(
+            "/v1/process",
+            files={"file": ("a.jpg", image_bytes, "image/jpeg")},
+            data={"coldpreview_size": "300"}
+        )
+        cached_entries = len(_result_cache)
+        response2 = client.post(
+            "/v1/process",
+            files={"file": ("b.jpg", image_bytes, "image/jpeg")},
+            data={"coldpreview_size": "300"}
+        )
+        
+        assert response1.status_code == 200
+        assert response2.status_code == 200
+        assert len(_result_cache) == cached_entries  # No new entry on hit
+        
+        photo_data1 = response1.json()
+        photo_data2 = response2.json()
+        assert photo_data1["hothash"] == photo_data2["hothash"]
+        assert photo_data1["coldpreview_base64"] == photo_data2["coldpreview_base64"]
+        
+        # Filename is per-request, never cached
+        assert photo_data2["image_file_list"][0]["filename"] == "b.jpg"
+
+    def test_disabled_cache_skips_hashing(self, monkeypatch):
+        """With IMALINK_CACHE_SIZE=0 uploads are not hashed or cached."""
+        import main
+        
+        monkeypatch.setattr(main, "_result_cache", main._ResultCache(maxsize=0))
+        with open(FIXTURES_DIR / "jpeg_basic.jpg", "rb") as f:
+            response = client.post(
+                "/v1/process",
+                files={"file": ("test.jpg", f, "image/jpeg")}
+            )
+        
+        assert response.status_code == 200
+        assert "hash;" not in response.headers["Server-Timing"]
+        assert len(main._result_cache) == 0
+
+
+class TestConcurrencyLimit:
+    """Test the processing concurrency limit."""
+
+    def test_queue_depth_header(self):
+        """Responses report how many requests were waiting for a slot."""
+        image_path = FIXTURES_DIR / "jpeg_basic.jpg"
+        
+        with open(image_path, "rb") as f:
+            response = client.post(
+                "/v1/process",
+                files={"file": ("test.jpg", f, "image/jpeg")}
+            )
+        
+        assert response.status_code == 200
+        assert response.headers["X-Queue-Depth"] == "0"  # Nothing else in flight
+
+
+class TestDeferredColdpreview:
+    """Test defer_coldpreview: coldpreview generated after the response."""
+
+    def test_deferred_coldpreview_polling(self):
+        """Response has no coldpreview; polling the token returns the full photo."""
+        image_path = FIXTURES_DIR / "jpeg_rotated.jpg"
+        
+        with open(image_path, "rb") as f:
+            response = client.post(
+                "/v1/process",
+                files={"file": ("deferred.jpg", f, "image/jpeg")},
+                data={"coldpreview_size": "400", "defer_coldpreview": "true"}
+            )
+        
+        assert response.status_code == 200
+        photo_data = response.json()
+        assert photo_data["hotpreview_base64"] is not None
+        assert photo_data["coldpreview_base64"] is None
+        
+        token = response.headers["X-Coldpreview-Token"]
+        
+        # TestClient runs background tasks before returning the response
+        result = client.get(f"/v1/process/{token}")
+        assert result.status_code == 200
+        full_data = result.json()
+        assert full_data["hothash"] == photo_data["hothash"]
+        assert full_data["coldpreview_base64"] is not None
+        assert max(full_data["coldpreview_width"], full_data["coldpreview_height"]) == 400
+        assert full_data["image_file_list"][0]["filename"] == "deferred.jpg"
+        
+        # Collected results are removed
+        assert client.get(f"/v1/process/{token}").status_code == 404
+
+    def test_pending_token(self, monkeypatch):
+        """Tokens whose coldpreview is still being generated return 202."""
+        import main
+        
+        monkeypatch.setattr(main, "_deferred_results", main._DeferredResults(maxsize=8, ttl=60))
+        token = main._deferred_results.create()
+        
+        response = client.get(f"/v1/process/{token}")
+        
+        assert response.status_code == 202
+        assert response.json() == {"status": "pending"}
+        assert len(main._deferred_results) == 1  # Still pending, not removed
+
+    def test_failed_background_job(self, monkeypatch):
+        """A failed coldpreview is reported once with 400, then the token is gone."""
+        import main
+        
+        def fail(*args, **kwargs):
+            raise ValueError("coldpreview failed")
+        
+        monkeypatch.setattr(main.PreviewGenerator, "reuse_jpeg_as_coldpreview", fail)
+        with open(FIXTURES_DIR / "jpeg_basic.jpg", "rb") as f:
+            response = client.post(
+                "/v1/process",
+                files={"file": ("test.jpg", f, "image/jpeg")},
+                data={"coldpreview_size": "401", "defer_coldpreview": "true"}
+            )
+        
+        assert response.status_code == 200
+        token = response.headers["X-Coldpreview-Token"]
+        
+        result = client.get(f"/v1/process/{token}")
+        assert result.status_code == 400
+        assert "coldpreview failed" in result.json()["detail"]
+        assert client.get(f"/v1/process/{token}").status_code == 404
+
+    def test_uncollected_results_expire(self, monkeypatch):
+        """Results nobody collects are dropped after the TTL."""
+        import main
+        
+        results = main._DeferredResults(maxsize=8, ttl=0)
+        monkeypatch.setattr(main, "_deferred_results", results)
+        token = results.create()
+        
+        assert client.get(f"/v1/process/{token}").status_code == 404
+        assert len(results) == 0
+
+    def test_no_token_without_coldpreview_size(self):
+        """Nothing to defer when no coldpreview is requested."""
+        image_path = FIXTURES_DIR / "jpeg_basic.jpg"
+        
+        with open(image_path, "rb") as f:
+            response = client.post(
+                "/v1/process",
+                files={"file": ("test.jpg", f, "image/jpeg")},
+                data={"defer_coldpreview": "true"}
+            )
+        
+        assert response.status_code == 200
+        assert "X-Coldpreview-Token" not in response.headers
+
+    def test_unknown_token(self):
+        """Unknown tokens return 404."""
+        response = client.get("/v1/process/does-not-exist")
+        
+        assert response.status_code == 404
+
+    def test_rejected_with_multiple_workers(self, monkeypatch):
+        """Deferring needs a single worker - tokens are per process."""
+        import main
+        
+        monkeypatch.setattr(main, "_workers", 2)
+        with open(FIXTURES_DIR / "jpeg_basic.jpg", "rb") as f:
+            response = client.post(
+                "/v1/process",
+                files={"file": ("test.jpg", f, "image/jpeg")},
+                data={"coldpreview_size": "512", "defer_coldpreview": "true"}
+            )
+        
+        assert response.status_code == 400
+        assert "IMALINK_WORKERS" in response.json()["detail"]
+
+
 class TestErrorHandling:
     """Test error cases and validation."""
 
@@ -314,6 +496,234 @@ class TestBase64Encoding:
             pytest.fail(f"Invalid Base64 encoding: {e}")
 
 
+class TestMultipartEncoding:
+    """Test ?encoding=multipart responses (raw JPEG parts instead of Base64)."""
+
+    @staticmethod
+    def _parse_parts(response):
+        """Split a multipart/mixed response into {name: (content_type, body)}."""
+        from email.parser import BytesParser
+        
+        raw = (
+            f"Content-Type: {response.headers['content-type']}\r\n\r\n"
+        ).encode() + response.content
+        message = BytesParser().parsebytes(raw)
+        return {
+            part.get_param("name", header="content-disposition"): (
+                part.get_content_type(),
+                part.get_payload(decode=True),
+            )
+            for part in message.get_payload()
+        }
+
+    def test_multipart_with_coldpreview(self):
+        """JSON part without Base64 fields, followed by raw JPEG parts."""
+        import json
+        
+        image_path = FIXTURES_DIR / "fuji_full_exif.jpg"
+        
+        with open(image_path, "rb") as f:
+            response = client.post(
+                "/v1/process?encoding=multipart",
+                files={"file": ("photo.jpg", f, "image/jpeg")},
+                data={"coldpreview_size": "1024"}
+            )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("multipart/mixed")
+        
+        parts = self._parse_parts(response)
+        assert set(parts) == {"photo", "hotpreview", "coldpreview"}
+        
+        content_type, body = parts["photo"]
+        assert content_type == "application/json"
+        photo_data = json.loads(body)
+        assert "hotpreview_base64" not in photo_data
+        assert photo_data["image_file_list"][0]["filename"] == "photo.jpg"
+        
+        for name in ("hotpreview", "coldpreview"):
+            content_type, body = parts[name]
+            assert content_type == "image/jpeg"
+            assert body[:2] == b"\xff\xd8"
+
+    def test_multipart_hothash_matches_base64(self):
+        """Hothash and preview bytes must not depend on the encoding."""
+        import base64
+        import json
+        
+        image_path = FIXTURES_DIR / "fuji_full_exif.jpg"
+        
+        with open(image_path, "rb") as f:
+            multipart = client.post(
+                "/v1/process?encoding=multipart",
+                files={"file": ("test.jpg", f, "image/jpeg")}
+            )
+        with open(image_path, "rb") as f:
+            inline = client.post(
+                "/v1/process",
+                files={"file": ("test.jpg", f, "image/jpeg")}
+            )
+        
+        parts = self._parse_parts(multipart)
+        assert "coldpreview" not in parts
+        assert json.loads(parts["photo"][1])["hothash"] == inline.json()["hothash"]
+        assert parts["hotpreview"][1] == base64.b64decode(inline.json()["hotpreview_base64"])
+
+    def test_invalid_encoding(self):
+        """Unknown encoding is rejected by validation."""
+        image_path = FIXTURES_DIR / "fuji_full_exif.jpg"
+        
+        with open(image_path, "rb") as f:
+            response = client.post(
+                "/v1/process?encoding=xml",
+                files={"file": ("test.jpg", f, "image/jpeg")}
+            )
+        
+        assert response.status_code == 422
+
+
+class TestBatchEndpoint:
+    """Test POST /v1/process_batch NDJSON streaming."""
+
+    @pytest.fixture(autouse=True)
+    def single_slot(self, monkeypatch):
+        """
+        One processing slot, fresh per test.
+        
+        Batch items wait on the limiter's semaphore, which binds to the first
+        event loop it waits in - and TestClient runs each request in a new loop.
+        """
+        import main
+        
+        monkeypatch.setattr(main, "_limiter", main._ProcessingLimiter(1))
+
+    def test_batch_returns_one_line_per_file(self):
+        """Every file gets a line; photos match single-file processing."""
+        import json
+        
+        names = ["fuji_full_exif.jpg", "jpeg_no_exif.jpg"]
+        files = [
+            ("files", (name, (FIXTURES_DIR / name).read_bytes(), "image/jpeg"))
+            for name in names
+        ]
+        
+        response = client.post("/v1/process_batch", files=files)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(line["index"] for line in lines) == [0, 1]
+        
+        for line in lines:
+            assert line["error"] is None
+            assert line["filename"] == names[line["index"]]
+            with open(FIXTURES_DIR / line["filename"], "rb") as f:
+                single = client.post(
+                    "/v1/process",
+                    files={"file": (line["filename"], f, "image/jpeg")}
+                )
+            assert line["photo"]["hothash"] == single.json()["hothash"]
+
+    def test_batch_reports_failures_per_file(self):
+        """A bad file yields an error line without failing the batch."""
+        import json
+        
+        files = [
+            ("files", (
+                "good.jpg", (FIXTURES_DIR / "fuji_full_exif.jpg").read_bytes(), "image/jpeg"
+            )),
+            ("files", ("bad.jpg", b"not an image", "image/jpeg")),
+        ]
+        
+        response = client.post(
+            "/v1/process_batch",
+            files=files,
+            data={"coldpreview_size": "512"}
+        )
+        
+        assert response.status_code == 200
+        lines = {line["index"]: line for line in map(json.loads, response.text.splitlines())}
+        assert lines[0]["photo"]["coldpreview_base64"] is not None
+        assert lines[1]["photo"] is None
+        assert "Invalid image file" in lines[1]["error"]
+
+    def test_batch_processes_largest_first(self):
+        """Slots are granted in descending file size, whatever the upload order."""
+        import json
+        
+        names = ["tiny_100x100.jpg", "sony_xperia.jpg", "jpeg_basic.jpg", "gps_sample.jpg"]
+        files = [
+            ("files", (name, (FIXTURES_DIR / name).read_bytes(), "image/jpeg"))
+            for name in names
+        ]
+        
+        response = client.post("/v1/process_batch", files=files)
+        
+        assert response.status_code == 200
+        completed = [json.loads(line)["filename"] for line in response.text.splitlines()]
+        by_size = sorted(names, key=lambda name: (FIXTURES_DIR / name).stat().st_size, reverse=True)
+        assert completed == by_size
+
+    def test_batch_too_many_files(self, monkeypatch):
+        """Batches above IMALINK_MAX_BATCH_FILES are rejected up front."""
+        import main
+        
+        monkeypatch.setattr(main, "_max_batch_files", 2)
+        image_bytes = (FIXTURES_DIR / "jpeg_no_exif.jpg").read_bytes()
+        
+        response = client.post(
+            "/v1/process_batch",
+            files=[("files", (f"{i}.jpg", image_bytes, "image/jpeg")) for i in range(3)]
+        )
+        
+        assert response.status_code == 400
+
+    def test_batch_invalid_coldpreview_size(self):
+        """coldpreview_size below hotpreview size is rejected up front."""
+        response = client.post(
+            "/v1/process_batch",
+            files=[("files", (
+                "a.jpg", (FIXTURES_DIR / "jpeg_no_exif.jpg").read_bytes(), "image/jpeg"
+            ))],
+            data={"coldpreview_size": "100"}
+        )
+        
+        assert response.status_code == 400
+
+
+class TestServerTiming:
+    """Test per-stage Server-Timing header on POST /v1/process."""
+
+    @staticmethod
+    def _stages(response):
+        stages = {}
+        for metric in response.headers["Server-Timing"].split(", "):
+            name, duration = metric.split(";dur=")
+            stages[name] = float(duration)
+        return stages
+
+    def test_stage_timings(self):
+        """Processed uploads report every pipeline stage; cache hits skip them."""
+        image_bytes = (FIXTURES_DIR / "jpeg_landscape.jpg").read_bytes()
+        
+        responses = [
+            client.post(
+                "/v1/process",
+                files={"file": ("test.jpg", image_bytes, "image/jpeg")},
+                data={"coldpreview_size": "333"}  # Unused elsewhere - first upload is a cache miss
+            )
+            for _ in range(2)
+        ]
+        
+        stages = self._stages(responses[0])
+        assert set(stages) == {
+            "read", "hash", "queue", "decode", "exif", "hotpreview", "coldpreview", "total"
+        }
+        assert all(duration >= 0 for duration in stages.values())
+        
+        assert set(self._stages(responses[1])) == {"read", "hash", "total"}
+
+
 class TestHealthCheck:
     """Test health check endpoint."""
 
@@ -325,3 +735,10 @@ class TestHealthCheck:
         data = response.json()
         
         assert data["status"] == "healthy"
+    
+    def test_startup_warm_up(self):
+        """Service starts (running the lifespan warm-up) and serves requests."""
+        with TestClient(app) as started_client:
+            response = started_client.get("/health")
+        
+        assert response.status_code == 200